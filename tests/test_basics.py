@@ -1,11 +1,14 @@
-import contextlib
+import operator
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime as dt
 from datetime import timedelta as td
 from datetime import timezone
+from functools import lru_cache, partial
+from itertools import accumulate, chain
+from random import Random
 
 import pytest
-from faker import Faker
 
 import timelineomat
 
@@ -22,161 +25,296 @@ class Event2:
     end: dt
 
 
-def _generate_time_tuple(faker, start):
-    return start, start + td(hours=faker.random_int(1, 48))
+class SortedTimeline:
+    """
+    Finished events ordered by stop (ascending appends of non-overlapping events).
+    Only the tail which ends after the start of a new event can overlap it.
+    """
+
+    def __init__(self, stop_extractor="stop"):
+        self.events = []
+        self.stops = []
+        self.stop_extractor = timelineomat.create_extractor(stop_extractor)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def candidates(self, start):
+        return self.events[bisect_right(self.stops, start) :]
+
+    def append(self, event):
+        self.events.append(event)
+        self.stops.append(self.stop_extractor(event))
+
+
+def _fast_append(event, timeline, start_extractor, streamline_event):
+    candidates = timeline.candidates(start_extractor(event))
+    # starts after the last event, nothing to streamline
+    if not candidates:
+        timeline.append(event)
+        return
+    timeline.append(streamline_event(event, candidates))
+
+
+rng = Random(0)
+_epoch = dt(1970, 1, 1)
+_microsecond = td(microseconds=1)
+
+
+def _to_us(value):
+    # naive datetimes as plain integers, independent of local time
+    return (value - _epoch) // _microsecond
+
+
+def _assert_sequential(events, start_extractor="start", stop_extractor="stop"):
+    start_extractor = timelineomat.create_extractor(start_extractor)
+    stop_extractor = timelineomat.create_extractor(stop_extractor)
+    starts = [_to_us(start_extractor(ev)) for ev in events]
+    stops = [_to_us(stop_extractor(ev)) for ev in events]
+    # every event must stop before the next one starts
+    assert all(map(operator.le, stops[:-1], starts[1:]))
+
+
+def _streamline_reference(starts, stops):
+    """
+    Integer only reference for streamlining start sorted events in order.
+    The finished events ending after a new start are contiguous, so only the last stop matters.
+    """
+    result = []
+    last_stop = None
+    for start, stop in zip(starts, stops):
+        if last_stop is not None:
+            start = max(start, last_stop)
+        if start < stop:
+            result.append((start, stop))
+            last_stop = stop
+    return result
+
+
+@lru_cache
+def _generate_times_us():
+    # integer microseconds, offsets of the starts and durations are whole hours
+    hour = td(hours=1) // _microsecond
+    base = _to_us(dt(2024, 1, 1))
+    offsets = accumulate(rng.randint(1, 48) * hour for _i in range(999))
+    starts = tuple(base + offset for offset in chain((0,), offsets))
+    stops = tuple(start + rng.randint(1, 48) * hour for start in starts)
+    return starts, stops
+
+
+@lru_cache
+def _generate_times():
+    # datetimes are only materialized once for the events
+    starts, stops = _generate_times_us()
+    return (
+        tuple(_epoch + start * _microsecond for start in starts),
+        tuple(_epoch + stop * _microsecond for stop in stops),
+    )
 
 
 def _generate_event_series(_type, _variant):
-    faker = Faker()
-    ts_start = faker.past_datetime(
-        "-200d",
+    # the times are shared, the events are updated by the tests so they are built fresh
+    starts, stops = _generate_times()
+    if _variant == 1:
+        return [_type(start=ts_start, stop=ts_stop) for ts_start, ts_stop in zip(starts, stops)]
+    return [_type(begin=ts_start, end=ts_stop) for ts_start, ts_stop in zip(starts, stops)]
+
+
+@pytest.fixture
+def events(request):
+    return _generate_event_series(*request.param)
+
+
+@pytest.mark.parametrize("use_timelineomat", [False, True])
+@pytest.mark.parametrize(
+    ("events", "start_key", "stop_key"),
+    [
+        ((Event1, 1), "start", "stop"),
+        ((Event2, 2), "begin", "end"),
+        ((dict, 1), "start", "stop"),
+        ((dict, 2), "begin", "end"),
+    ],
+    indirect=["events"],
+)
+def test_streamline(events, start_key, stop_key, use_timelineomat):
+    # getters resolve the keys in C, the setters still use the key names
+    getter = operator.itemgetter if isinstance(events[0], dict) else operator.attrgetter
+    start_extractor = getter(start_key)
+    stop_extractor = getter(stop_key)
+    kwargs = {
+        "start_extractor": start_extractor,
+        "stop_extractor": stop_extractor,
+        "start_setter": start_key,
+        "stop_setter": stop_key,
+    }
+    if use_timelineomat:
+        streamline_event = timelineomat.TimelineOMat(**kwargs).streamline_event
+    else:
+        streamline_event = partial(timelineomat.streamline_event, **kwargs)
+    events_finished = SortedTimeline(stop_extractor)
+    for ev in events:
+        try:
+            _fast_append(ev, events_finished, start_extractor, streamline_event)
+        except timelineomat.SkipEvent:
+            continue
+    _assert_sequential(events_finished, start_extractor, stop_extractor)
+    assert [
+        (_to_us(start_extractor(ev)), _to_us(stop_extractor(ev))) for ev in events_finished
+    ] == _streamline_reference(*_generate_times_us())
+
+
+@pytest.mark.parametrize("use_timelineomat", [False, True])
+@pytest.mark.parametrize("events", [(Event1, 1), (dict, 1)], indirect=True)
+def test_build_timeline(events, use_timelineomat):
+    shuffled = events[:]
+    rng.shuffle(shuffled)
+    build_timeline = timelineomat.TimelineOMat().build_timeline if use_timelineomat else timelineomat.build_timeline
+    occlusions = []
+    timeline = build_timeline(shuffled[:500], shuffled[500:], occlusions=occlusions)
+    start_extractor = timelineomat.create_extractor("start")
+    stop_extractor = timelineomat.create_extractor("stop")
+    assert [(_to_us(start_extractor(ev)), _to_us(stop_extractor(ev))) for ev in timeline] == _streamline_reference(
+        *_generate_times_us()
     )
-    events = []
-    for _i in range(1000):
-        ts_stop = _generate_time_tuple(faker, ts_start)[1]
-        if _variant == 1:
-            events.append(_type(start=ts_start, stop=ts_stop))
-        else:
-            events.append(_type(begin=ts_start, end=ts_stop))
-        ts_start += td(hours=faker.random_int(1, 48))
-    return events
+    assert occlusions
+    # timelines stay ascending, a streamlined timeline is kept as it is
+    assert build_timeline(timeline) == timeline
 
 
-def test_event1_direct():
-    events = _generate_event_series(Event1, 1)
-    events_finished = []
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(timelineomat.streamline_event(ev, events_finished))
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event.stop <= ev.start
-        last_event = ev
-
-
-def test_event2_direct():
-    events = _generate_event_series(Event2, 2)
-    events_finished = []
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(
-                timelineomat.streamline_event(
-                    ev,
-                    events_finished,
-                    start_extractor="begin",
-                    stop_extractor="end",
-                )
-            )
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event.end <= ev.begin
-        last_event = ev
-
-
-def test_dict1_direct():
-    events = _generate_event_series(dict, 1)
-    events_finished = []
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(
-                timelineomat.streamline_event(
-                    ev,
-                    events_finished,
-                )
-            )
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event["start"] <= ev["stop"]
-        last_event = ev
-
-
-def test_dict2_direct():
-    events = _generate_event_series(dict, 2)
-    events_finished = []
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(
-                timelineomat.streamline_event(
-                    ev,
-                    events_finished,
-                    start_extractor="begin",
-                    stop_extractor="end",
-                )
-            )
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event["end"] <= ev["begin"]
-        last_event = ev
-
-
-def test_event1_timelineomat():
-    events = _generate_event_series(Event1, 1)
-    events_finished = []
-    tm = timelineomat.TimelineOMat()
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(tm.streamline_event(ev, events_finished))
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event.stop <= ev.start
-        last_event = ev
-
-
-def test_event2_timelineomat():
-    events = _generate_event_series(Event2, 2)
-    events_finished = []
-    tm = timelineomat.TimelineOMat(start_extractor="begin", stop_extractor="end")
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(tm.streamline_event(ev, events_finished))
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event.end <= ev.begin
-        last_event = ev
+def test_build_timeline_desc():
+    tm = timelineomat.TimelineOMat(direction="desc")
+    timeline = tm.build_timeline([Event1(start=dt(2024, 1, day), stop=dt(2024, 1, day, 12)) for day in (5, 1, 3)])
+    tm.ordered_insert(Event1(start=dt(2024, 1, 7), stop=dt(2024, 1, 7, 12)), timeline)
+    assert [ev.start.day for ev in timeline] == [1, 3, 5, 7]
+
+
+@pytest.mark.parametrize("use_timelineomat", [False, True])
+def test_build_timeline_filter(use_timelineomat):
+    def filter_fn(ev):
+        return ev.stop.hour % 3 != 0
+
+    events = _generate_event_series(Event1, 1)[:200]
+    expected = []
+    for ev in sorted((Event1(start=ev.start, stop=ev.stop) for ev in events), key=lambda ev: (ev.start, ev.stop)):
+        try:
+            timelineomat.ordered_insert(timelineomat.streamline_event(ev, expected, filter_fn=filter_fn), expected)
+        except timelineomat.SkipEvent:
+            continue
+    shuffled = events[:]
+    rng.shuffle(shuffled)
+    if use_timelineomat:
+        timeline = timelineomat.TimelineOMat(filter_fn=filter_fn).build_timeline(shuffled)
+    else:
+        timeline = timelineomat.build_timeline(shuffled, filter_fn=filter_fn)
+    # events which don't pass the filter are kept but don't trim others
+    assert len(timeline) > len(timelineomat.build_timeline(_generate_event_series(Event1, 1)[:200]))
+    assert timeline == expected
+
+
+@pytest.mark.parametrize("use_timelineomat", [False, True])
+def test_streamline_interval_index(use_timelineomat):
+    if use_timelineomat:
+        tm = timelineomat.TimelineOMat()
+        streamline_event = tm.streamline_event
+        index = tm.interval_index()
+    else:
+        streamline_event = timelineomat.streamline_event
+        index = timelineomat.IntervalIndex()
+    for ev in _generate_event_series(Event1, 1):
+        try:
+            index.add(streamline_event(ev, index))
+        except timelineomat.SkipEvent:
+            continue
+    assert [(_to_us(ev.start), _to_us(ev.stop)) for ev in index] == _streamline_reference(*_generate_times_us())
+
+
+@pytest.mark.parametrize("use_timelineomat", [False, True])
+def test_streamline_events(use_timelineomat):
+    series = _generate_event_series(Event1, 1)
+    timeline = series[::2]
+    new_events = series[1::2]
+    expected = []
+    for ev in new_events:
+        try:
+            expected.append(timelineomat.streamline_event(Event1(start=ev.start, stop=ev.stop), timeline))
+        except timelineomat.SkipEvent:
+            continue
+    occlusions = []
+    if use_timelineomat:
+        result = timelineomat.TimelineOMat().streamline_events(new_events, timeline, occlusions=occlusions)
+    else:
+        result = timelineomat.streamline_events(new_events, timeline, occlusions=occlusions)
+    assert result == expected
+    assert occlusions
+    # the events are streamlined by the call itself
+    event = Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 20))
+    timelineomat.streamline_events([event], [Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 10))])
+    assert event.start == dt(2024, 1, 10)
+
+
+def test_streamline_events_start_order():
+    days = {day: dt(2024, 1, day) for day in range(1, 12)}
+    timeline = [Event1(start=days[3], stop=days[7]), Event1(start=days[1], stop=days[4])]
+    assert timelineomat.streamline_event(Event1(start=days[1], stop=days[11]), timeline).start == days[4]
+    # the timeline events are applied ordered by start
+    (ev,) = timelineomat.streamline_events([Event1(start=days[1], stop=days[11])], timeline)
+    assert ev.start == days[7]
+    assert ev == timelineomat.streamline_event(
+        Event1(start=days[1], stop=days[11]), sorted(timeline, key=lambda ev: ev.start)
+    )
 
 
-def test_dict1_timelineomat():
-    events = _generate_event_series(dict, 1)
-    tm = timelineomat.TimelineOMat()
-    events_finished = []
-    for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(
-                tm.streamline_event(
-                    ev,
-                    events_finished,
-                )
-            )
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event["start"] <= ev["stop"]
-        last_event = ev
-
-
-def test_dict2_timelineomat():
-    events = _generate_event_series(dict, 2)
-    tm = timelineomat.TimelineOMat(start_extractor="begin", stop_extractor="end")
-    events_finished = []
+def test_interval_index_overlaps():
+    index = timelineomat.IntervalIndex(
+        [
+            Event1(start=dt(2024, 1, 5), stop=dt(2024, 1, 6)),
+            # invalid event
+            {},
+            Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 2)),
+            Event1(start=dt(2024, 1, 3), stop=dt(2024, 1, 20)),
+            Event1(start=dt(2024, 1, 10), stop=dt(2024, 1, 11)),
+        ]
+    )
+    assert len(index) == 4
+    assert [ev.start for ev in index] == [dt(2024, 1, 1), dt(2024, 1, 3), dt(2024, 1, 5), dt(2024, 1, 10)]
+    assert index.add(Event1(start=dt(2024, 1, 2), stop=dt(2024, 1, 3))) == 1
+    assert [ev.start for ev in index.overlaps(dt(2024, 1, 2), dt(2024, 1, 5))] == [dt(2024, 1, 2), dt(2024, 1, 3)]
+    assert [ev.start for ev in index.overlaps(dt(2024, 1, 12), dt(2024, 1, 13))] == [dt(2024, 1, 3)]
+    assert list(index.overlaps(dt(2024, 1, 20), dt(2024, 1, 21))) == []
+    with pytest.raises(timelineomat.SkipEvent):
+        timelineomat.streamline_event_times(Event1(start=dt(2024, 1, 12), stop=dt(2024, 1, 13)), index)
+    # the filter also applies to events of an IntervalIndex
+    assert timelineomat.streamline_event_times(
+        Event1(start=dt(2024, 1, 10), stop=dt(2024, 1, 13)), index, filter_fn=lambda ev: ev.stop != dt(2024, 1, 20)
+    ) == timelineomat.TimeRangeTuple(start=dt(2024, 1, 11), stop=dt(2024, 1, 13))
+
+
+def test_interval_index_bulk():
+    events = _generate_event_series(Event1, 1)
+    rng.shuffle(events)
+    index = timelineomat.IntervalIndex(events[:500], events[500:])
+    incremental = timelineomat.IntervalIndex()
     for ev in events:
-        with contextlib.suppress(timelineomat.SkipEvent):
-            events_finished.append(
-                tm.streamline_event(
-                    ev,
-                    events_finished,
-                )
-            )
-    last_event = None
-    for ev in events_finished:
-        if last_event:
-            assert last_event["end"] <= ev["begin"]
-        last_event = ev
+        try:
+            incremental.add(ev)
+        except timelineomat.SkipEvent:
+            continue
+    assert index.events == incremental.events
+    assert index.starts == incremental.starts
+    assert index.stops == incremental.stops
+    assert index.max_stops == incremental.max_stops
+
+
+def test_interval_index_long_event():
+    long_event = Event1(start=dt(2024, 1, 1), stop=dt(2024, 2, 1))
+    short_events = [Event1(start=dt(2024, 1, day), stop=dt(2024, 1, day, 12)) for day in range(2, 29)]
+    index = timelineomat.IntervalIndex([*short_events, long_event])
+    assert index.max_stops == [dt(2024, 2, 1)] * len(index)
+    assert list(index.overlaps(dt(2024, 1, 5, 6), dt(2024, 1, 5, 18))) == [long_event, short_events[3]]
+    # running maxima of events added before the long event
+    index = timelineomat.IntervalIndex(short_events, [Event1(start=dt(2024, 3, 1), stop=dt(2024, 4, 1))])
+    assert index.max_stops == [*index.stops[:-1], dt(2024, 4, 1)]
+    assert list(index.overlaps(dt(2024, 1, 5, 6), dt(2024, 1, 5, 18))) == [short_events[3]]
 
 
 def test_invalid():
@@ -223,6 +361,31 @@ def test_result_fallback_utc():
     )
 
 
+def test_handle_result_str():
+    assert timelineomat.handle_result("2024-01-01T00:00:00", timezone.utc) == dt(2024, 1, 1, tzinfo=timezone.utc)
+    assert timelineomat.handle_result("2024-01-01T00:00:00+01:00", timezone.utc).utcoffset() == td(hours=1)
+    assert timelineomat.handle_result("2024-01-01T00:00:00").tzinfo is None
+    with pytest.raises(TypeError):
+        timelineomat.handle_result(None)
+
+
+def test_time_range_tuples_fallback_utc():
+    timeline = [timelineomat.TimeRangeTuple(start=dt(2024, 1, 1), stop=dt(2024, 1, 3))]
+    new_event = Event1(start=dt(2024, 1, 2), stop=dt(2024, 1, 4))
+    assert timelineomat.streamline_event_times(
+        new_event, timeline, fallback_timezone=timezone.utc
+    ) == timelineomat.TimeRangeTuple(
+        start=dt(2024, 1, 3, tzinfo=timezone.utc), stop=dt(2024, 1, 4, tzinfo=timezone.utc)
+    )
+    # timestamps are converted and the filter applies as well
+    timeline = [timelineomat.TimeRangeTuple(start=dt(2024, 1, 1).timestamp(), stop=dt(2024, 1, 3).timestamp())]
+    assert timelineomat.streamline_event_times(new_event, timeline) == (dt(2024, 1, 3), dt(2024, 1, 4))
+    assert timelineomat.streamline_event_times(new_event, timeline, filter_fn=lambda ev: False) == (
+        dt(2024, 1, 2),
+        dt(2024, 1, 4),
+    )
+
+
 def one_time_overwrite_end(ev):
     if isinstance(ev, dict):
         return ev["end"]
@@ -231,35 +394,37 @@ def one_time_overwrite_end(ev):
 
 
 def test_onetime_overwrite():
-    timeline = [Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 2)), Event1(start=dt(2024, 1, 2), stop=dt(2024, 1, 3))]
-    new_event1 = Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 4))
-    new_event2 = dict(start=dt(2024, 1, 1).timestamp(), end=dt(2024, 1, 5).timestamp())
+    days = {day: dt(2024, 1, day) for day in range(1, 6)}
+    timestamps = {day: value.timestamp() for day, value in days.items()}
+    timeline = [Event1(start=days[1], stop=days[2]), Event1(start=days[2], stop=days[3])]
+    new_event1 = Event1(start=days[1], stop=days[4])
+    new_event2 = dict(start=timestamps[1], end=timestamps[5])
 
     tm = timelineomat.TimelineOMat()
     timeline.append(tm.streamline_event(new_event1, timeline))
-    assert timeline[-1].stop == dt(2024, 1, 4)
-    assert timeline[-1].start == dt(2024, 1, 3)
+    assert timeline[-1].stop == days[4]
+    assert timeline[-1].start == days[3]
     timeline.append(
         Event1(**tm.streamline_event_times(new_event2, timeline, stop_extractor=one_time_overwrite_end)._asdict())
     )
-    assert timeline[-1].stop == dt(2024, 1, 5)
-    assert timeline[-1].start == dt(2024, 1, 4)
+    assert timeline[-1].stop == days[5]
+    assert timeline[-1].start == days[4]
     # test conversion in TimeRangeTuple array
     assert [t for t, ev in tm.transform_events_to_times(timeline)] == [
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 1), stop=dt(2024, 1, 2)),
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 2), stop=dt(2024, 1, 3)),
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 3), stop=dt(2024, 1, 4)),
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 4), stop=dt(2024, 1, 5)),
+        timelineomat.TimeRangeTuple(start=days[1], stop=days[2]),
+        timelineomat.TimeRangeTuple(start=days[2], stop=days[3]),
+        timelineomat.TimeRangeTuple(start=days[3], stop=days[4]),
+        timelineomat.TimeRangeTuple(start=days[4], stop=days[5]),
     ]
     # test sorting
 
     assert [
         t for t, ev in tm.transform_events_to_times(sorted(timeline, key=tm.streamline_event_times, reverse=True))
     ] == [
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 4), stop=dt(2024, 1, 5)),
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 3), stop=dt(2024, 1, 4)),
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 2), stop=dt(2024, 1, 3)),
-        timelineomat.TimeRangeTuple(start=dt(2024, 1, 1), stop=dt(2024, 1, 2)),
+        timelineomat.TimeRangeTuple(start=days[4], stop=days[5]),
+        timelineomat.TimeRangeTuple(start=days[3], stop=days[4]),
+        timelineomat.TimeRangeTuple(start=days[2], stop=days[3]),
+        timelineomat.TimeRangeTuple(start=days[1], stop=days[2]),
     ]
 
 
@@ -333,6 +498,39 @@ def test_ordered_insert_desc():
     assert position == 2
 
 
+def test_ordered_insert_desc_newest():
+    timeline = [Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 2))]
+    assert timelineomat.ordered_insert(
+        Event1(start=dt(2024, 1, 7), stop=dt(2024, 1, 8)), timeline, direction="desc"
+    ) == (1, 0)
+    timeline = [Event1(start=dt(2024, 1, 1), stop=dt(2024, 1, 2)), {}]
+    # the newest event is inserted directly behind the last valid event
+    assert timelineomat.ordered_insert(
+        Event1(start=dt(2024, 1, 5), stop=dt(2024, 1, 6)), timeline, direction="desc"
+    ) == (1, 1)
+    assert timelineomat.ordered_insert(
+        Event1(start=dt(2024, 1, 3), stop=dt(2024, 1, 4)), timeline, direction="desc", offset=1
+    ) == (1, 2)
+
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_bulk_ordered_insert(direction):
+    series = _generate_event_series(Event1, 1)
+    timeline = series[::3]
+    # invalid events keep their place relative to the valid ones
+    timeline.insert(10, {})
+    timeline.insert(0, {})
+    new_events = series[1::3] + series[2::3]
+    rng.shuffle(new_events)
+    expected = timeline[:]
+    for ev in sorted(new_events, key=lambda ev: (ev.start, ev.stop), reverse=direction == "desc"):
+        timelineomat.ordered_insert(ev, expected, direction=direction)
+    timelineomat.TimelineOMat(direction=direction).bulk_ordered_insert([*new_events, {}], timeline)
+    assert timeline == expected
+    with pytest.raises(AssertionError):
+        timelineomat.bulk_ordered_insert(new_events, timeline, offset=5)
+
+
 def test_streamlined_ordered_insert_desc():
     # desc is more complicated
     timeline = [
@@ -379,3 +577,97 @@ def test_invalid_rejection():
         tm.streamline_event_times(new_event1)
     with pytest.raises(timelineomat.SkipEvent):
         tm.ordered_insert(new_event1, timeline)
+
+
+@pytest.mark.parametrize("event_kind", [None, dict, Event1])
+def test_create_extractor(event_kind):
+    extractor = timelineomat.create_extractor("start", event_kind)
+    if event_kind is not Event1:
+        assert extractor({"start": dt(2024, 1, 1)}) == dt(2024, 1, 1)
+        with pytest.raises(timelineomat.SkipInvalidEvent):
+            extractor({})
+    if event_kind is not dict:
+        assert extractor(Event1(start=dt(2024, 1, 2), stop=dt(2024, 1, 3))) == dt(2024, 1, 2)
+        with pytest.raises(timelineomat.SkipInvalidEvent):
+            extractor(object())
+
+
+def test_streamline_key_extractors_mixed():
+    timeline = [
+        {"start": dt(2024, 1, 1), "stop": dt(2024, 1, 3)},
+        {"start": dt(2024, 1, 2)},
+        Event1(start="2024-01-05T00:00:00", stop=dt(2024, 1, 9).timestamp()),
+        Event1(start=dt(2024, 1, 7), stop=dt(2024, 1, 7)),
+        object(),
+    ]
+    new_event = Event1(start=dt(2024, 1, 2), stop=dt(2024, 1, 8))
+    # callables take the generic extraction path
+    assert timelineomat.streamline_event_times(new_event, timeline) == timelineomat.streamline_event_times(
+        new_event,
+        timeline,
+        start_extractor=lambda ev: timelineomat.create_extractor("start")(ev),
+        stop_extractor=lambda ev: timelineomat.create_extractor("stop")(ev),
+    )
+    assert timelineomat.streamline_event_times(new_event, timeline) == timelineomat.TimeRangeTuple(
+        start=dt(2024, 1, 3), stop=dt(2024, 1, 5)
+    )
+
+
+def test_callable_extractor_with_key_attribute():
+    class Parse:
+        def __init__(self, key):
+            self.key = key
+
+        def __call__(self, ev):
+            return ev.raw[self.key]
+
+    class RawEvent:
+        def __init__(self, **raw):
+            self.raw = raw
+
+    timeline = [RawEvent(start=dt(2024, 1, 1), stop=dt(2024, 1, 3))]
+    assert timelineomat.streamline_event_times(
+        RawEvent(start=dt(2024, 1, 2), stop=dt(2024, 1, 4)),
+        timeline,
+        start_extractor=Parse("start"),
+        stop_extractor=Parse("stop"),
+    ) == timelineomat.TimeRangeTuple(start=dt(2024, 1, 3), stop=dt(2024, 1, 4))
+
+
+def test_kind_fixed_extractors():
+    start_extractor = timelineomat.create_extractor("start", Event1)
+    stop_extractor = timelineomat.create_extractor("stop", Event1)
+    dict_event = {"start": dt(2024, 1, 1), "stop": dt(2024, 1, 3)}
+    with pytest.raises(timelineomat.SkipEvent):
+        timelineomat.extract_tuple_from_event(dict_event, start_extractor, stop_extractor)
+    # the events of the wrong kind are invalid for every helper
+    times = timelineomat.transform_events_to_times(
+        [dict_event], start_extractor=start_extractor, stop_extractor=stop_extractor
+    )
+    assert list(times) == []
+    assert timelineomat.streamline_event_times(
+        Event1(start=dt(2024, 1, 2), stop=dt(2024, 1, 4)),
+        [dict_event],
+        start_extractor=start_extractor,
+        stop_extractor=stop_extractor,
+    ) == timelineomat.TimeRangeTuple(start=dt(2024, 1, 2), stop=dt(2024, 1, 4))
+
+
+def test_streamline_benchmark(benchmark):
+    # plain list timeline, every event is checked against all finished events
+    tm = timelineomat.TimelineOMat()
+
+    def setup():
+        return (_generate_event_series(Event1, 1)[:200],), {}
+
+    def streamline(events):
+        events_finished = []
+        for ev in events:
+            try:
+                events_finished.append(tm.streamline_event(ev, events_finished))
+            except timelineomat.SkipEvent:
+                continue
+        return events_finished
+
+    events_finished = benchmark.pedantic(streamline, setup=setup, rounds=5)
+    _assert_sequential(events_finished)
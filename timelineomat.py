@@ -1,7 +1,11 @@
 __all__ = [
     "streamline_event_times",
     "streamline_event",
+    "streamline_events",
     "ordered_insert",
+    "bulk_ordered_insert",
+    "build_timeline",
+    "IntervalIndex",
     "TimelineOMat",
     "SkipEvent",
     "SkipInvalidEvent",
@@ -11,12 +15,15 @@ __all__ = [
     "TimeRangeTuple",
 ]
 
-from collections.abc import Callable, Iterable, MutableSequence, Sequence
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
 from datetime import datetime as dt
 from datetime import timezone as tz
 from functools import lru_cache
-from itertools import chain
+from itertools import accumulate, chain, islice
+from operator import attrgetter, itemgetter
 from typing import Literal, NamedTuple, Optional, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 Event = TypeVar("Event")
 Offset = TypeVar("Offset", bound=int)
@@ -61,24 +68,103 @@ class NoCallAllowedError(Exception):
 
 # old name
 NewTimesResult = TimeRangeTuple
-_empty = frozenset()
 
 
-def create_extractor(extractor: Extractor) -> CallableExtractor:
-    if not isinstance(extractor, str):
-        return extractor
+def _key_getter(event_kind: type, *keys: str) -> Callable[[Event], ExtractionResult]:
+    # the C getters save a python frame per extraction, with multiple keys they return a tuple
+    return itemgetter(*keys) if issubclass(event_kind, dict) else attrgetter(*keys)
+
+
+# extractors built by _create_key_extractor with their key and fixed event kind
+_key_extractors: WeakKeyDictionary[CallableExtractor, tuple[str, Optional[type]]] = WeakKeyDictionary()
+
+
+@lru_cache(256)
+def _create_key_extractor(extractor: str, event_kind: Optional[type] = None) -> CallableExtractor:
+    if event_kind is not None:
+        getter = _key_getter(event_kind, extractor)
+
+        def _extractor(event: Event) -> ExtractionResult:
+            try:
+                return getter(event)
+            except (KeyError, AttributeError) as exc:
+                raise SkipInvalidEvent from exc
+
+        _key_extractors[_extractor] = (extractor, event_kind)
+        return _extractor
+
+    # the access kind is decided once per event type
+    getters: dict[type, CallableExtractor] = {}
 
     def _extractor(event: Event) -> ExtractionResult:
+        getter = getters.get(type(event))
+        if getter is None:
+            getter = getters[type(event)] = _key_getter(type(event), extractor)
         try:
-            if isinstance(event, dict):
-                return event[extractor]
-            return getattr(event, extractor)
+            return getter(event)
         except (KeyError, AttributeError) as exc:
             raise SkipInvalidEvent from exc
 
+    _key_extractors[_extractor] = (extractor, None)
     return _extractor
 
 
+@lru_cache(256)
+def _create_key_pair_getter(
+    start_key: str, stop_key: str, event_kind: Optional[type] = None
+) -> Callable[[Event], tuple[ExtractionResult, ExtractionResult]]:
+    # fetches start and stop with one call, raises KeyError or AttributeError for invalid events
+    if event_kind is not None:
+        return _key_getter(event_kind, start_key, stop_key)
+    getters: dict[type, Callable[[Event], tuple[ExtractionResult, ExtractionResult]]] = {}
+
+    def _pair_getter(event: Event) -> tuple[ExtractionResult, ExtractionResult]:
+        getter = getters.get(type(event))
+        if getter is None:
+            getter = getters[type(event)] = _key_getter(type(event), start_key, stop_key)
+        return getter(event)
+
+    return _pair_getter
+
+
+def _key_pair_getter(
+    start_extractor: CallableExtractor, stop_extractor: CallableExtractor
+) -> Optional[Callable[[Event], tuple[ExtractionResult, ExtractionResult]]]:
+    # only for extractors created from strings
+    try:
+        start_entry = _key_extractors.get(start_extractor)
+        stop_entry = _key_extractors.get(stop_extractor)
+    except TypeError:
+        # not weak referenceable or not hashable, so no key extractor
+        return None
+    if start_entry is None or stop_entry is None:
+        return None
+    start_key, start_kind = start_entry
+    stop_key, stop_kind = stop_entry
+    if start_kind is not stop_kind:
+        # one getter call can only use one access kind
+        return None
+    return _create_key_pair_getter(start_key, stop_key, start_kind)
+
+
+def create_extractor(extractor: Extractor, event_kind: Optional[type] = None) -> CallableExtractor:
+    if not isinstance(extractor, str):
+        return extractor
+    # string extractors are built once per name (and event kind if known)
+    return _create_key_extractor(extractor, event_kind)
+
+
+@lru_cache(256)
+def _create_key_setter(setter: str) -> CallableSetter:
+    def _setter(event: Event, value: dt) -> None:
+        if isinstance(event, dict):
+            event[setter] = value
+        else:
+            setattr(event, setter, value)
+
+    return _setter
+
+
 def create_setter(
     setter: Setter,
     *,
@@ -95,28 +181,28 @@ def create_setter(
 
             return _setter
         return setter
-
-    def _setter(event: Event, value: dt) -> None:
-        if isinstance(event, dict):
-            event[setter] = value
-        else:
-            setattr(event, setter, value)
-
-    return _setter
+    return _create_key_setter(setter)
 
 
-@lru_cache(1024, typed=True)
 def handle_result(result: ExtractionResult, fallback_timezone: Optional[tz] = None) -> dt:
-    if isinstance(result, dt):
-        if fallback_timezone and not result.tzinfo:
-            result = result.replace(tzinfo=fallback_timezone)
+    # datetimes which need no fallback timezone are passed through without hashing them for the cache
+    if type(result) is dt and (fallback_timezone is None or result.tzinfo is not None):
         return result
+    return _handle_result(result, fallback_timezone)
+
+
+@lru_cache(16384, typed=True)
+def _handle_result(result: ExtractionResult, fallback_timezone: Optional[tz] = None) -> dt:
+    if isinstance(result, str):
+        # parsed inline, the parsed datetime would only cost another cache entry
+        result = dt.fromisoformat(result)
     elif isinstance(result, (int, float)):
         return dt.fromtimestamp(result, fallback_timezone)
-    elif isinstance(result, str):  # type: ignore
-        return handle_result(dt.fromisoformat(result), fallback_timezone=fallback_timezone)
-    else:
+    elif not isinstance(result, dt):
         raise TypeError(f"not supported type: {type(result)}")
+    if fallback_timezone and not result.tzinfo:
+        result = result.replace(tzinfo=fallback_timezone)
+    return result
 
 
 def extract_tuple_from_event(
@@ -125,75 +211,252 @@ def extract_tuple_from_event(
     stop_extractor: CallableExtractor,
     fallback_timezone: Optional[tz] = None,
 ) -> TimeRangeTuple:
-    start = handle_result(start_extractor(event), fallback_timezone=fallback_timezone)
-    stop = handle_result(stop_extractor(event), fallback_timezone=fallback_timezone)
-    if stop <= start:
+    times = _extract_times(event, start_extractor, stop_extractor, fallback_timezone)
+    if times is None:
         raise SkipInvalidEvent("duration <= 0")
-    return TimeRangeTuple(start=start, stop=stop)
+    return TimeRangeTuple._make(times)
+
+
+def _extract_times(
+    event: Event,
+    start_extractor: CallableExtractor,
+    stop_extractor: CallableExtractor,
+    fallback_timezone: Optional[tz] = None,
+) -> Optional[tuple[dt, dt]]:
+    # None instead of raising for a duration <= 0, the loops skip such events without an exception
+    # a plain tuple is cheaper to build than a TimeRangeTuple, callers wrap it when it leaves the module
+    start = start_extractor(event)
+    stop = stop_extractor(event)
+    # inlined fast path of handle_result, saves two calls per event
+    if type(start) is not dt or (fallback_timezone is not None and start.tzinfo is None):
+        start = _handle_result(start, fallback_timezone)
+    if type(stop) is not dt or (fallback_timezone is not None and stop.tzinfo is None):
+        stop = _handle_result(stop, fallback_timezone)
+    if stop <= start:
+        return None
+    return start, stop
+
+
+def _extract_key_times(
+    event: Event,
+    pair_getter: Callable[[Event], tuple[ExtractionResult, ExtractionResult]],
+    fallback_timezone: Optional[tz] = None,
+) -> Optional[tuple[dt, dt]]:
+    # like _extract_times for string extractors, but also None instead of raising for missing keys
+    try:
+        start, stop = pair_getter(event)
+    except (KeyError, AttributeError):
+        return None
+    if type(start) is not dt or type(stop) is not dt or fallback_timezone is not None:
+        start = handle_result(start, fallback_timezone)
+        stop = handle_result(stop, fallback_timezone)
+    if stop <= start:
+        return None
+    return start, stop
+
 
+class IntervalIndex:
+    """
+    Events ordered by start together with the running maximum of their stops.
+    Used as timeline only events which can overlap are checked in start order, with the times extracted on add.
+    The extractors and the fallback timezone must match the ones used for streamlining.
+    """
+
+    start_extractor: CallableExtractor
+    stop_extractor: CallableExtractor
+    fallback_timezone: Optional[tz]
+    starts: list[dt]
+    stops: list[dt]
+    events: list[Event]
+    max_stops: list[dt]
 
-def _array_window(array: Sequence[Event], offset, direction: Literal["asc", "desc"]):
-    length = len(array)
+    def __init__(
+        self,
+        *timelines,
+        start_extractor: Extractor = "start",
+        stop_extractor: Extractor = "stop",
+        fallback_timezone: Optional[tz] = None,
+    ):
+        self.start_extractor = create_extractor(start_extractor)
+        self.stop_extractor = create_extractor(stop_extractor)
+        self.fallback_timezone = fallback_timezone
+        entries = []
+        for ev in chain.from_iterable(timelines):
+            try:
+                times = _extract_times(ev, self.start_extractor, self.stop_extractor, fallback_timezone)
+            except SkipEvent:
+                continue
+            if times is not None:
+                entries.append((*times, ev))
+        # sorting once is cheaper than inserting every event, the sort is stable like the bisect_right in add
+        entries.sort(key=itemgetter(0))
+        self.starts = [entry[0] for entry in entries]
+        self.stops = [entry[1] for entry in entries]
+        self.events = [entry[2] for entry in entries]
+        self.max_stops = list(accumulate(self.stops, max))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self.events)
+
+    def add(self, event: Event) -> Position:
+        times = _extract_times(event, self.start_extractor, self.stop_extractor, self.fallback_timezone)
+        if times is None:
+            raise SkipInvalidEvent("duration <= 0")
+        start, stop = times
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.stops.insert(position, stop)
+        self.events.insert(position, event)
+        max_stops = self.max_stops
+        if position and max_stops[position - 1] > stop:
+            max_stops.insert(position, max_stops[position - 1])
+        else:
+            max_stops.insert(position, stop)
+        # the following maxima only change until one already reaches stop
+        for pos in range(position + 1, len(max_stops)):
+            if max_stops[pos] >= stop:
+                break
+            max_stops[pos] = stop
+        return position
+
+    def _overlapping_positions(self, start: dt, stop: dt) -> Iterator[Position]:
+        # all events before lo stop at or before start
+        lo = bisect_right(self.max_stops, start)
+        hi = bisect_left(self.starts, stop)
+        for pos in range(lo, hi):
+            if self.stops[pos] > start:
+                yield pos
+
+    def overlaps(self, start: dt, stop: dt) -> Iterator[Event]:
+        for pos in self._overlapping_positions(start, stop):
+            yield self.events[pos]
+
+
+def _iter_candidate_times(
+    timelines: Iterable[Iterable[Event]],
+    start: dt,
+    stop: dt,
+    start_extractor: CallableExtractor,
+    stop_extractor: CallableExtractor,
+    filter_fn: Optional[FilterFunction],
+    fallback_timezone: Optional[tz],
+) -> Iterator[tuple[dt, dt]]:
+    # string extractors are specialized to one getter call for start and stop
+    pair_getter = _key_pair_getter(start_extractor, stop_extractor)
+    for timeline in timelines:
+        if isinstance(timeline, IntervalIndex):
+            # the times are already extracted
+            for pos in timeline._overlapping_positions(start, stop):
+                if filter_fn and not filter_fn(timeline.events[pos]):
+                    continue
+                yield timeline.starts[pos], timeline.stops[pos]
+            continue
+        for ev in timeline:
+            if filter_fn and not filter_fn(ev):
+                continue
+            if pair_getter is not None:
+                # inlined _extract_key_times
+                try:
+                    ev_start, ev_stop = pair_getter(ev)
+                except (KeyError, AttributeError):
+                    continue
+                if type(ev_start) is not dt or type(ev_stop) is not dt or fallback_timezone is not None:
+                    ev_start = handle_result(ev_start, fallback_timezone)
+                    ev_stop = handle_result(ev_stop, fallback_timezone)
+                if ev_start < ev_stop:
+                    yield ev_start, ev_stop
+                continue
+            try:
+                ev_times = _extract_times(ev, start_extractor, stop_extractor, fallback_timezone)
+            except SkipEvent:
+                continue
+            if ev_times is not None:
+                yield ev_times
+
+
+def _array_window(array: Sequence[Event], offset, direction: Literal["asc", "desc"]) -> Iterator[Event]:
+    # iterates in C, without copying the window
     if direction == "asc":
-        for pos in range(offset, length):
-            yield array[pos]
-    else:
-        for pos in range(offset, length):
-            yield array[length - pos - 1]
+        return islice(array, offset, None)
+    return islice(reversed(array), offset, None)
 
 
 def _streamline_event_times(
     event: Event,
-    timeline: Iterable[Event],
-    start_extractor: Extractor = "start",
-    stop_extractor: Extractor = "stop",
+    timelines: Sequence[Iterable[Event]],
+    start_extractor: CallableExtractor,
+    stop_extractor: CallableExtractor,
     filter_fn: Optional[FilterFunction] = None,
     fallback_timezone: Optional[tz] = None,
-    **kwargs,
-) -> tuple[TimeRangeTuple, TimeRangeTuple]:
-    start_extractor = create_extractor(start_extractor)
-    stop_extractor = create_extractor(stop_extractor)
-    start, stop = orig_tuple = extract_tuple_from_event(event, start_extractor, stop_extractor, fallback_timezone)
-    if not timeline:
+) -> tuple[tuple[dt, dt], tuple[dt, dt]]:
+    orig_tuple = _extract_times(event, start_extractor, stop_extractor, fallback_timezone)
+    if orig_tuple is None:
+        raise SkipInvalidEvent("duration <= 0")
+    if not timelines:
         return orig_tuple, orig_tuple
-    for ev in timeline:
-        if filter_fn and not filter_fn(ev):
-            continue
-        try:
-            ev_start, ev_stop = extract_tuple_from_event(ev, start_extractor, stop_extractor, fallback_timezone)
-        except SkipEvent:
-            continue
-        if ev_start <= start and ev_stop >= stop:
-            raise SkipOccludedEvent(original=orig_tuple)
-        if ev_start <= start and ev_stop > start:
-            start = ev_stop
-        if ev_start < stop and ev_stop >= stop:
+    start, stop = orig_tuple
+    for ev_start, ev_stop in _iter_candidate_times(
+        timelines, start, stop, start_extractor, stop_extractor, filter_fn, fallback_timezone
+    ):
+        # start < stop holds after every step, no recheck needed
+        if ev_start <= start:
+            if ev_stop >= stop:
+                raise SkipOccludedEvent(original=TimeRangeTuple._make(orig_tuple))
+            if ev_stop > start:
+                start = ev_stop
+        elif ev_stop >= stop and ev_start < stop:
             stop = ev_start
-        if stop <= start:
-            raise SkipOccludedEvent(original=orig_tuple)
-    return TimeRangeTuple(start=start, stop=stop), orig_tuple
+    return (start, stop), orig_tuple
 
 
-def streamline_event_times(
+def _streamline_event_times_prepared(
     event: Event,
-    *timelines,
+    timelines: Sequence[Iterable[Event]],
+    start_extractor: CallableExtractor,
+    stop_extractor: CallableExtractor,
+    filter_fn: Optional[FilterFunction] = None,
+    fallback_timezone: Optional[tz] = None,
     occlusions: Optional[list[TimeRangeTuple]] = None,
-    **kwargs,
 ) -> TimeRangeTuple:
+    # the extractors must already be created, TimelineOMat passes its own directly
     try:
         new_tuple, orig_tuple = _streamline_event_times(
-            event, chain.from_iterable(timelines) if timelines else _empty, **kwargs
+            event, timelines, start_extractor, stop_extractor, filter_fn, fallback_timezone
         )
     except SkipOccludedEvent as exc:
         if occlusions is not None:
             occlusions.append(exc.original)
         raise exc
     if new_tuple != orig_tuple and occlusions is not None:
-        if orig_tuple.start != new_tuple.start:
-            occlusions.append(TimeRangeTuple(start=orig_tuple.start, stop=new_tuple.start))
-        if orig_tuple.stop != new_tuple.stop:
-            occlusions.append(TimeRangeTuple(start=new_tuple.stop, stop=orig_tuple.stop))
-    return new_tuple
+        if orig_tuple[0] != new_tuple[0]:
+            occlusions.append(TimeRangeTuple(start=orig_tuple[0], stop=new_tuple[0]))
+        if orig_tuple[1] != new_tuple[1]:
+            occlusions.append(TimeRangeTuple(start=new_tuple[1], stop=orig_tuple[1]))
+    return TimeRangeTuple._make(new_tuple)
+
+
+def streamline_event_times(
+    event: Event,
+    *timelines,
+    start_extractor: Extractor = "start",
+    stop_extractor: Extractor = "stop",
+    filter_fn: Optional[FilterFunction] = None,
+    fallback_timezone: Optional[tz] = None,
+    occlusions: Optional[list[TimeRangeTuple]] = None,
+    **kwargs,
+) -> TimeRangeTuple:
+    return _streamline_event_times_prepared(
+        event,
+        timelines,
+        create_extractor(start_extractor),
+        create_extractor(stop_extractor),
+        filter_fn,
+        fallback_timezone,
+        occlusions,
+    )
 
 
 def streamline_event(
@@ -217,7 +480,7 @@ def streamline_event(
         stop_setter = create_setter(stop_extractor, disallow_call_instant=True)
     new_tuple = streamline_event_times(
         event,
-        chain.from_iterable(timelines),
+        *timelines,
         start_extractor=start_extractor,
         stop_extractor=stop_extractor,
         **kwargs,
@@ -227,6 +490,56 @@ def streamline_event(
     return event
 
 
+def streamline_events(
+    events: Iterable[Event],
+    *timelines,
+    start_extractor: Extractor = "start",
+    stop_extractor: Extractor = "stop",
+    start_setter: Optional[Setter] = None,
+    stop_setter: Optional[Setter] = None,
+    filter_fn: Optional[FilterFunction] = None,
+    fallback_timezone: Optional[tz] = None,
+    occlusions: Optional[list[TimeRangeTuple]] = None,
+    **kwargs,
+) -> list[Event]:
+    """
+    Streamline many events against the same timelines, which are indexed only once.
+    The events are not streamlined against each other (see build_timeline), skipped events are left out of the result.
+    Like for an IntervalIndex the timeline events are applied ordered by start, for unsorted timelines with
+    overlapping events the result can differ from streamline_event.
+    """
+    if start_setter is not None:
+        start_setter = create_setter(start_setter)
+    else:
+        start_setter = create_setter(start_extractor, disallow_call_instant=True)
+    if stop_setter is not None:
+        stop_setter = create_setter(stop_setter)
+    else:
+        stop_setter = create_setter(stop_extractor, disallow_call_instant=True)
+    start_extractor = create_extractor(start_extractor)
+    stop_extractor = create_extractor(stop_extractor)
+    index = (
+        IntervalIndex(
+            *timelines,
+            start_extractor=start_extractor,
+            stop_extractor=stop_extractor,
+            fallback_timezone=fallback_timezone,
+        ),
+    )
+    streamlined = []
+    for event in events:
+        try:
+            new_tuple = _streamline_event_times_prepared(
+                event, index, start_extractor, stop_extractor, filter_fn, fallback_timezone, occlusions
+            )
+        except SkipEvent:
+            continue
+        start_setter(event, new_tuple.start)
+        stop_setter(event, new_tuple.stop)
+        streamlined.append(event)
+    return streamlined
+
+
 def transform_events_to_times(
     *timelines,
     start_extractor: Extractor = "start",
@@ -240,14 +553,65 @@ def transform_events_to_times(
     stop_extractor = create_extractor(stop_extractor)
     if not timelines:
         return
+    pair_getter = _key_pair_getter(start_extractor, stop_extractor)
     for ev in chain.from_iterable(timelines):
         if filter_fn and not filter_fn(ev):
             continue
+        if pair_getter is not None:
+            ev_times = _extract_key_times(ev, pair_getter, fallback_timezone)
+        else:
+            try:
+                ev_times = _extract_times(ev, start_extractor, stop_extractor, fallback_timezone)
+            except SkipEvent:
+                continue
+        if ev_times is not None:
+            yield TimeRangeTuple._make(ev_times), ev
+
+
+def _bisect_timeline(
+    times_at: Callable[[Position], Optional[tuple[dt, dt]]],
+    lo: Position,
+    hi: Position,
+    predicate: Callable[[tuple[dt, dt]], bool],
+) -> Position:
+    """
+    Return the first position in [lo, hi) of a valid event matching predicate, hi if there is none.
+    predicate must be monotonic over the valid events, invalid events (times_at returns None) are stepped over.
+    """
+    end = hi
+    while lo < hi:
+        mid = (lo + hi) // 2
+        position = mid
+        ev_times = times_at(position)
+        while ev_times is None and position + 1 < hi:
+            position += 1
+            ev_times = times_at(position)
+        if ev_times is None or predicate(ev_times):
+            hi = mid
+        else:
+            lo = position + 1
+    while lo < end and times_at(lo) is None:
+        lo += 1
+    return lo
+
+
+def _create_times_of(
+    start_extractor: CallableExtractor,
+    stop_extractor: CallableExtractor,
+    fallback_timezone: Optional[tz] = None,
+) -> Callable[[Event], Optional[tuple[dt, dt]]]:
+    # string extractors return None for invalid events without raising
+    pair_getter = _key_pair_getter(start_extractor, stop_extractor)
+
+    def times_of(ev: Event) -> Optional[tuple[dt, dt]]:
+        if pair_getter is not None:
+            return _extract_key_times(ev, pair_getter, fallback_timezone)
         try:
-            retval = (extract_tuple_from_event(ev, start_extractor, stop_extractor, fallback_timezone), ev)
-            yield retval
+            return _extract_times(ev, start_extractor, stop_extractor, fallback_timezone)
         except SkipEvent:
-            continue
+            return None
+
+    return times_of
 
 
 def _ordered_insert(
@@ -268,32 +632,28 @@ def _ordered_insert(
     if not len(timeline):
         timeline.append(event)
         return 0
-    last_pos = None
     length = len(timeline)
-    for position in range(offset, length):
-        if direction == "desc":
-            position = length - position - 1
-        ev = timeline[position]
-        try:
-            ev_times = extract_tuple_from_event(ev, start_extractor, stop_extractor, fallback_timezone)
-        except SkipEvent:
-            last_pos = position
-            continue
-        if direction == "asc":
-            if ev_times > event_times:
-                timeline.insert(position, event)
-                return position
-        else:
-            if ev_times < event_times:
-                timeline.insert(last_pos, event)
-                return last_pos
-        last_pos = position
+    # the part of the timeline which is searched, offset counts from the end for desc
+    window = max(length - offset, 0)
+
+    times_of = _create_times_of(start_extractor, stop_extractor, fallback_timezone)
+
     if direction == "asc":
-        timeline.append(event)
-        return length
+
+        def times_at(position: Position) -> Optional[tuple[dt, dt]]:
+            return times_of(timeline[position])
+
+        # in front of the first event which is greater
+        position = _bisect_timeline(times_at, length - window, length, event_times.__lt__)
     else:
-        timeline.insert(0, event)
-        return 0
+
+        def times_at(position: Position) -> Optional[tuple[dt, dt]]:
+            return times_of(timeline[window - position - 1])
+
+        # behind the last event which is smaller, searched from the end
+        position = window - _bisect_timeline(times_at, 0, window, event_times.__gt__)
+    timeline.insert(position, event)
+    return position
 
 
 def ordered_insert(
@@ -310,6 +670,66 @@ def ordered_insert(
     return PositionOffsetTuple(position=position, offset=position)
 
 
+def bulk_ordered_insert(
+    events: Iterable[Event],
+    timeline: MutableSequence[Event],
+    *,
+    direction: Literal["asc", "desc"] = "asc",
+    start_extractor: Extractor = "start",
+    stop_extractor: Extractor = "stop",
+    fallback_timezone: Optional[tz] = None,
+    **kwargs,
+) -> None:
+    """
+    Insert many events into an ordered timeline at once.
+    Same result as ordered_insert of the events sorted in direction, but with one merge instead of a shift per event.
+    Events with invalid times are left out. The whole timeline is merged, so there is no offset.
+    """
+    assert "occlusions" not in kwargs, "occlusions not supported for this function"
+    assert not kwargs, f"unsupported arguments: {', '.join(kwargs)}"
+    start_extractor = create_extractor(start_extractor)
+    stop_extractor = create_extractor(stop_extractor)
+    times_of = _create_times_of(start_extractor, stop_extractor, fallback_timezone)
+    new_events = list(
+        transform_events_to_times(
+            events, start_extractor=start_extractor, stop_extractor=stop_extractor, fallback_timezone=fallback_timezone
+        )
+    )
+    if direction == "asc":
+        new_events.sort(key=itemgetter(0))
+    else:
+        # later inserted equal events end up in front
+        new_events.sort(key=itemgetter(0), reverse=True)
+        new_events.reverse()
+    merged = []
+    # invalid events which are not yet placed, desc inserts directly behind the last smaller valid event
+    pending = []
+    position = 0
+    length = len(timeline)
+    for times, event in new_events:
+        while position < length:
+            ev = timeline[position]
+            ev_times = times_of(ev)
+            if ev_times is None:
+                if direction == "asc":
+                    merged.append(ev)
+                else:
+                    pending.append(ev)
+            elif (times < ev_times) if direction == "asc" else (ev_times >= times):
+                break
+            else:
+                merged.extend(pending)
+                pending.clear()
+                merged.append(ev)
+            position += 1
+        merged.append(event)
+    merged.extend(pending)
+    merged.extend(islice(timeline, position, None))
+    # MutableSequence doesn't guarantee slice assignment
+    timeline.clear()
+    timeline.extend(merged)
+
+
 def streamlined_ordered_insert(
     event: Event,
     timeline: MutableSequence[Event],
@@ -355,6 +775,57 @@ def streamlined_ordered_insert(
     )
 
 
+def build_timeline(
+    *timelines,
+    start_extractor: Extractor = "start",
+    stop_extractor: Extractor = "stop",
+    start_setter: Optional[Setter] = None,
+    filter_fn: Optional[FilterFunction] = None,
+    fallback_timezone: Optional[tz] = None,
+    occlusions: Optional[list[TimeRangeTuple]] = None,
+    **kwargs,
+) -> list[Event]:
+    """
+    Build a streamlined timeline from unordered events in one sweep.
+    Like streamlined_ordered_insert of every event in start order, but without a lookup and list shift per event.
+    filter_fn only decides which events trim the following ones, every valid event which is not occluded is kept.
+    Only starts are updated, the setter is only called for trimmed events.
+    """
+    if start_setter is not None:
+        start_setter = create_setter(start_setter)
+    else:
+        start_setter = create_setter(start_extractor, disallow_call=True)
+    times_events = list(
+        transform_events_to_times(
+            *timelines,
+            start_extractor=start_extractor,
+            stop_extractor=stop_extractor,
+            fallback_timezone=fallback_timezone,
+        )
+    )
+    times_events.sort(key=itemgetter(0))
+    kept = []
+    last_stop = None
+    for (start, stop), ev in times_events:
+        # sorted by start, the kept events passing the filter are disjoint so only the last stop can overlap
+        if last_stop is not None and start < last_stop:
+            if stop <= last_stop:
+                if occlusions is not None:
+                    occlusions.append(TimeRangeTuple(start=start, stop=stop))
+                continue
+            if occlusions is not None:
+                occlusions.append(TimeRangeTuple(start=start, stop=last_stop))
+            start = last_stop
+            start_setter(ev, start)
+        kept.append(((start, stop), ev))
+        if filter_fn is None or filter_fn(ev):
+            last_stop = stop
+    if filter_fn is not None:
+        # events which don't pass the filter can overlap, so trimmed events may move behind them
+        kept.sort(key=itemgetter(0))
+    return [ev for _times, ev in kept]
+
+
 class TimelineOMat:
     start_extractor: CallableExtractor
     stop_extractor: CallableExtractor
@@ -389,40 +860,49 @@ class TimelineOMat:
         else:
             self.stop_setter = create_setter(stop_extractor, disallow_call=True)
 
+    def interval_index(self, *timelines, **kwargs) -> IntervalIndex:
+        return IntervalIndex(
+            *timelines,
+            start_extractor=kwargs.get("start_extractor", self.start_extractor),
+            stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
+            fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
+        )
+
     def streamline_event_times(self, event: Event, *timelines, **kwargs) -> TimeRangeTuple:
-        if timelines:
-            return streamline_event_times(
-                event,
-                chain.from_iterable(timelines),
-                start_extractor=kwargs.get("start_extractor", self.start_extractor),
-                stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
-                filter_fn=kwargs.get("filter_fn", self.filter_fn),
-                fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
-                occlusions=kwargs.get("occlusions", None),
-            )
-        else:
-            return streamline_event_times(
-                event,
-                start_extractor=kwargs.get("start_extractor", self.start_extractor),
-                stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
-                filter_fn=kwargs.get("filter_fn", self.filter_fn),
-                fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
-                occlusions=kwargs.get("occlusions", None),
-            )
+        return _streamline_event_times_prepared(
+            event,
+            timelines,
+            create_extractor(kwargs["start_extractor"]) if "start_extractor" in kwargs else self.start_extractor,
+            create_extractor(kwargs["stop_extractor"]) if "stop_extractor" in kwargs else self.stop_extractor,
+            kwargs.get("filter_fn", self.filter_fn),
+            kwargs.get("fallback_timezone", self.fallback_timezone),
+            kwargs.get("occlusions", None),
+        )
 
     def streamline_event(self, event: Event, *timelines, **kwargs) -> Event:
         if not timelines:
             return event
-        return streamline_event(
-            event,
-            chain.from_iterable(timelines),
+        # the prepared extractors and setters are used directly, only overwrites are created
+        new_tuple = self.streamline_event_times(event, *timelines, **kwargs)
+        start_setter = (
+            self.start_setter if kwargs.get("start_setter") is None else create_setter(kwargs["start_setter"])
+        )
+        stop_setter = self.stop_setter if kwargs.get("stop_setter") is None else create_setter(kwargs["stop_setter"])
+        start_setter(event, new_tuple.start)
+        stop_setter(event, new_tuple.stop)
+        return event
+
+    def streamline_events(self, events: Iterable[Event], *timelines, **kwargs) -> list[Event]:
+        return streamline_events(
+            events,
+            *timelines,
             start_extractor=kwargs.get("start_extractor", self.start_extractor),
             stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
             filter_fn=kwargs.get("filter_fn", self.filter_fn),
             fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
             start_setter=kwargs.get("start_setter", self.start_setter),
             stop_setter=kwargs.get("stop_setter", self.stop_setter),
-            occlusions=kwargs.get("occlusions", None),
+            occlusions=kwargs.get("occlusions"),
         )
 
     def transform_events_to_times(self, *timelines, **kwargs) -> Iterable[tuple[TimeRangeTuple, Event]]:
@@ -430,13 +910,24 @@ class TimelineOMat:
         if not timelines:
             return []
         return transform_events_to_times(
-            chain.from_iterable(timelines),
+            *timelines,
             start_extractor=kwargs.get("start_extractor", self.start_extractor),
             stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
             filter_fn=kwargs.get("filter_fn", self.filter_fn),
             fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
         )
 
+    def build_timeline(self, *timelines, **kwargs) -> list[Event]:
+        return build_timeline(
+            *timelines,
+            start_extractor=kwargs.get("start_extractor", self.start_extractor),
+            stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
+            start_setter=kwargs.get("start_setter", self.start_setter),
+            filter_fn=kwargs.get("filter_fn", self.filter_fn),
+            fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
+            occlusions=kwargs.get("occlusions"),
+        )
+
     def ordered_insert(
         self,
         event: Event,
@@ -456,6 +947,17 @@ class TimelineOMat:
             fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
         )
 
+    def bulk_ordered_insert(self, events: Iterable[Event], timeline: MutableSequence[Event], **kwargs) -> None:
+        assert "occlusions" not in kwargs, "occlusions not supported for this function"
+        return bulk_ordered_insert(
+            events,
+            timeline,
+            start_extractor=kwargs.get("start_extractor", self.start_extractor),
+            stop_extractor=kwargs.get("stop_extractor", self.stop_extractor),
+            direction=kwargs.get("direction", self.direction),
+            fallback_timezone=kwargs.get("fallback_timezone", self.fallback_timezone),
+        )
+
     def streamlined_ordered_insert(
         self,
         event: Event,